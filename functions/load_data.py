@@ -1,10 +1,188 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+import asyncio
+import functools
+import json
 import os
+import re
+import aiohttp
 import requests
+import requests_cache
 import pandas as pd
+import pyarrow as pa
 import yfinance as yf
 
+# Maximum number of NewsAPI requests in flight at once.
+NEWS_CONCURRENCY = 8
+
+# NewsAPI error codes that fail every request, so the remaining days are not fetched.
+NEWS_FATAL_ERRORS = {
+    "apiKeyDisabled",
+    "apiKeyExhausted",
+    "apiKeyInvalid",
+    "apiKeyMissing",
+    "rateLimited",
+}
+
+# Arrow-backed dtypes of the news tables, set explicitly so empty results keep them.
+NEWS_TEXT_DTYPE = pd.ArrowDtype(pa.large_string())
+NEWS_DATE_DTYPE = pd.ArrowDtype(pa.timestamp("ns", tz="UTC"))
+
+# Yahoo Finance accepts up to this many symbols per download request.
+YF_BATCH_SIZE = 20
+
+STOCK_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# On-disk cache for Yahoo Finance responses and downloaded price history.
+CACHE_DIR = Path(".cache")
+CACHE_TTL = timedelta(hours=12)
+
+_TICKER_CACHE: dict[str, yf.Ticker] = {}
+
+# Bundled display names for commonly analyzed tickers, used before asking Yahoo Finance.
+TICKER_NAMES_PATH = Path(__file__).with_name("ticker_names.json")
+
+# Legal-form suffixes stripped from Yahoo Finance names to match the bundled display names.
+_LEGAL_SUFFIX = re.compile(
+    r"[,\s]+(?:Inc|Incorporated|Corp|Corporation|Co|Ltd|Limited|plc|N\.V|S\.A|AG|SE"
+    r"|LLC|L\.P)\.?$",
+    re.IGNORECASE,
+)
+
+
+@functools.cache
+def _load_api_keys() -> tuple[str, str]:
+    """
+    Loads NewsAPI and APITube API keys from a .env file.
+
+    The .env file is read once per process.
+
+    Returns:
+        tuple: (news_api_key, apitube_api_key)
+
+    Raises:
+        ValueError: If any API key is missing from the environment.
+    """
+    load_dotenv()
+    api_key_news = os.getenv("API_KEY_NEWSAPI")
+    api_key_apitube = os.getenv("API_KEY_APITUBE")
+
+    missing = []
+    if not api_key_news:
+        missing.append("NewsAPI")
+    if not api_key_apitube:
+        missing.append("APITube")
+
+    if missing:
+        raise ValueError(
+            f"Missing API key(s): {', '.join(missing)}. Check your .env file."
+        )
+
+    return api_key_news, api_key_apitube
+
+
+@functools.cache
+def _ticker_names() -> dict[str, str]:
+    """
+    Loads the bundled mapping from ticker symbol to company display name.
+    """
+    with open(TICKER_NAMES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.cache
+def _yf_session() -> requests_cache.CachedSession:
+    """
+    Returns the shared SQLite-backed HTTP session used for Yahoo Finance requests.
+    """
+    CACHE_DIR.mkdir(exist_ok=True)
+    return requests_cache.CachedSession(
+        str(CACHE_DIR / "yfinance.cache"), backend="sqlite", expire_after=CACHE_TTL
+    )
+
+
+def _get_ticker(stock_symbol: str) -> yf.Ticker:
+    """
+    Returns a cached yfinance Ticker for the given symbol, creating it on first use.
+    """
+    if stock_symbol not in _TICKER_CACHE:
+        _TICKER_CACHE[stock_symbol] = yf.Ticker(stock_symbol, session=_yf_session())
+    return _TICKER_CACHE[stock_symbol]
+
+
+def _default_start_date() -> str:
+    """
+    Returns the default start date, 12 weeks ago from today, formatted as YYYY-MM-DD.
+    """
+    return (datetime.now() - timedelta(weeks=12)).strftime("%Y-%m-%d")
+
+
+def _stock_cache_path(stock_symbol: str, start_date: str) -> Path:
+    """
+    Returns the parquet cache file for a symbol's price history from start_date.
+    """
+    return CACHE_DIR / f"{stock_symbol}_{start_date}.parquet"
+
+
+def _is_fresh(path: Path) -> bool:
+    """
+    Checks whether a cache file exists and is younger than CACHE_TTL.
+    """
+    if not path.exists():
+        return False
+    modified = datetime.fromtimestamp(path.stat().st_mtime)
+    return datetime.now() - modified < CACHE_TTL
+
+
+def _parse_news_dates(dates: list[str]) -> pd.Series:
+    """
+    Parses ISO 8601 timestamps into a UTC timestamp column; unparseable values become null.
+    """
+    parsed = pd.to_datetime(dates, utc=True, format="ISO8601", errors="coerce")
+    return pd.Series(parsed).astype(NEWS_DATE_DTYPE)
+
+
+def _split_by_ticker(
+    data: pd.DataFrame, symbols: list[str]
+) -> dict[str, pd.DataFrame]:
+    """
+    Splits a yf.download result into one DataFrame per symbol with flat price columns.
+
+    Handles ticker-grouped (Ticker, Price) and default (Price, Ticker) MultiIndex
+    columns, as well as the flat columns some yfinance versions return for one symbol.
+    """
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data} if len(symbols) == 1 else {}
+
+    frames = {}
+    for symbol in symbols:
+        ticker = symbol.upper()
+        if ticker in data.columns.get_level_values(0):
+            frames[symbol] = data[ticker]
+        elif ticker in data.columns.get_level_values(-1):
+            frames[symbol] = data.xs(ticker, axis=1, level=-1)
+    return frames
+
+
+def _run_sync(coro):
+    """
+    Runs a coroutine to completion from synchronous code.
+
+    Uses a worker thread when an event loop is already running (e.g. inside a
+    Jupyter notebook), since asyncio.run cannot be nested.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 
 class LoadData:
     """
@@ -23,37 +201,140 @@ class LoadData:
             stock_symbol (str): The stock ticker symbol (e.g., 'AAPL').
         """
         self.stock_symbol = stock_symbol
-        self.start_date = (datetime.now() - timedelta(weeks=12)).strftime("%Y-%m-%d")
-        self.api_keys = self._load_api_keys()
-        ticker = yf.Ticker(stock_symbol)
-        self.name = ticker.info.get("displayName", stock_symbol)
+        self.start_date = _default_start_date()
+        self.api_keys = _load_api_keys()
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
+        self.name = _ticker_names().get(stock_symbol.upper())
+        if self.name is None:
+            self.name = self._fetch_name_from_yf(stock_symbol)
+
+        self._news_base = "https://newsapi.org/v2/everything?" + urlencode(
+            {"q": self.name, "sortBy": "popularity", "apiKey": self.api_keys[0]}
+        )
 
-    def _load_api_keys(self) -> tuple[str, str]:
+    @staticmethod
+    def _fetch_name_from_yf(stock_symbol: str) -> str:
         """
-        Loads NewsAPI and APITube API keys from a .env file.
+        Looks up the company display name of a ticker on Yahoo Finance.
+
+        Legal-form suffixes are removed so the result matches the bundled names
+        (e.g., 'Apple Inc.' becomes 'Apple').
+
+        Args:
+            stock_symbol (str): The stock ticker symbol (e.g., 'AAPL').
 
         Returns:
-            tuple: (news_api_key, apitube_api_key)
+            str: The company name, or the symbol itself if the lookup fails.
+        """
+        # The chart metadata carries the company name and costs a single request,
+        # unlike ticker.info which scrapes several quote-summary modules.
+        try:
+            metadata = _get_ticker(stock_symbol).history_metadata
+            name = metadata.get("shortName") or metadata.get("longName")
+        except Exception:
+            return stock_symbol
+
+        if not name:
+            return stock_symbol
+        while True:
+            stripped = _LEGAL_SUFFIX.sub("", name).strip()
+            if stripped == name or not stripped:
+                break
+            name = stripped
+        return name
+
+    def __enter__(self) -> "LoadData":
+        return self
 
-        Raises:
-            ValueError: If any API key is missing from the environment.
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP session used for news requests.
         """
-        load_dotenv()
-        api_key_news = os.getenv("API_KEY_NEWSAPI")
-        api_key_apitube = os.getenv("API_KEY_APITUBE")
+        self._session.close()
 
-        missing = []
-        if not api_key_news:
-            missing.append("NewsAPI")
-        if not api_key_apitube:
-            missing.append("APITube")
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Removes all cached Yahoo Finance responses, Ticker objects and price history.
+        """
+        _TICKER_CACHE.clear()
+        _yf_session().cache.clear()
+        for path in CACHE_DIR.glob("*.parquet"):
+            path.unlink()
 
-        if missing:
-            raise ValueError(
-                f"Missing API key(s): {', '.join(missing)}. Check your .env file."
+    @classmethod
+    def load_many(
+        cls, symbols: list[str], start_date: datetime | None = None
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Downloads historical stock data for several symbols using batched yfinance requests.
+
+        Symbols are requested YF_BATCH_SIZE at a time. Results are cached on disk for
+        CACHE_TTL, keyed by symbol and start date.
+
+        Args:
+            symbols (list[str]): Stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+            start_date (datetime | None): Optional start date. If not provided, defaults to
+                12 weeks ago from today.
+
+        Returns:
+            dict[str, pd.DataFrame]: Mapping from symbol to a DataFrame with Open, High, Low,
+                Close, and Volume columns. Symbols without data are omitted.
+        """
+        start_date_str = (
+            start_date.strftime("%Y-%m-%d") if start_date else _default_start_date()
+        )
+
+        results = {}
+        pending = []
+        for symbol in symbols:
+            cache_path = _stock_cache_path(symbol, start_date_str)
+            if _is_fresh(cache_path):
+                results[symbol] = pd.read_parquet(cache_path)
+            else:
+                pending.append(symbol)
+
+        for i in range(0, len(pending), YF_BATCH_SIZE):
+            batch = pending[i : i + YF_BATCH_SIZE]
+            data = yf.download(
+                " ".join(batch),
+                start=start_date_str,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                auto_adjust=True,
+                prepost=False,
+                session=_yf_session(),
             )
+            frames = _split_by_ticker(data, batch)
+
+            for symbol in batch:
+                frame = frames.get(symbol)
+                if frame is None or frame.empty:
+                    print(f"No data found for '{symbol}'.")
+                    continue
 
-        return api_key_news, api_key_apitube
+                stock_data = frame[STOCK_COLUMNS].dropna(how="all")
+                if stock_data.empty:
+                    print(f"No data found for '{symbol}'.")
+                    continue
+
+                CACHE_DIR.mkdir(exist_ok=True)
+                stock_data.to_parquet(_stock_cache_path(symbol, start_date_str))
+                results[symbol] = stock_data
+
+        return results
 
     def load_stock_data(
         self, start_date: datetime | None = None
@@ -69,59 +350,121 @@ class LoadData:
             pd.DataFrame | None: DataFrame with Open, High, Low, Close, and Volume columns,
                 or None if no data is found.
         """
-        start_date_str = (
-            start_date.strftime("%Y-%m-%d") if start_date else self.start_date
-        )
+        if start_date is None:
+            start_date = datetime.strptime(self.start_date, "%Y-%m-%d")
+        return self.load_many([self.stock_symbol], start_date).get(self.stock_symbol)
 
-        stock_data = yf.download(self.stock_symbol, start=start_date_str)
+    async def _fetch_day(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        date_str: str,
+    ) -> tuple[list[tuple[str, str, str]], tuple[str, str] | None]:
+        """
+        Fetches the news articles for a single day from NewsAPI.
 
-        if stock_data.empty:
-            print(f"No data found for '{self.stock_symbol}'.")
-            return None
+        Only the headline, publication date and description are kept, so the decoded
+        response is released as soon as the day has been processed.
 
-        return stock_data[["Open", "High", "Low", "Close", "Volume"]]
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
+            date_str (str): Day to fetch, formatted as YYYY-MM-DD.
+
+        Returns:
+            tuple: (articles, error) where articles is a list of (headline, date,
+                description) triples and error is the NewsAPI (code, message) pair,
+                or None.
+        """
+        url = f"{self._news_base}&from={date_str}&to={date_str}"
+        async with semaphore:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                data = await response.json()
+
+        if "articles" not in data:
+            return [], (data.get("code"), data.get("message", "unknown error"))
+
+        articles = [
+            (article["title"], article["publishedAt"], article["description"])
+            for article in data["articles"]
+        ]
+        return articles, None
+
+    async def _fetch_all(
+        self,
+    ) -> list[tuple[list[tuple[str, str, str]], tuple[str, str] | None]]:
+        """
+        Fetches news articles for every day from start_date until today concurrently.
+
+        Outstanding requests are cancelled as soon as a day returns one of
+        NEWS_FATAL_ERRORS.
+
+        Returns:
+            list[tuple]: (articles, error) per completed day, ordered by date.
+        """
+        start = datetime.strptime(self.start_date, "%Y-%m-%d")
+        dates = [
+            (start + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((datetime.now() - start).days + 1)
+        ]
+
+        semaphore = asyncio.Semaphore(NEWS_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = []
+
+            async def fetch(date_str: str) -> tuple:
+                articles, error = await self._fetch_day(session, semaphore, date_str)
+                if error is not None and error[0] in NEWS_FATAL_ERRORS:
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                return articles, error
+
+            tasks.extend(asyncio.create_task(fetch(date_str)) for date_str in dates)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [task.result() for task in tasks if not task.cancelled()]
 
     def load_news_data(self) -> pd.DataFrame:
         """
         Fetches recent news articles using NewsAPI, day-by-day from start_date.
 
         Returns:
-            pd.DataFrame: DataFrame containing article headline, publication date, and description.
-        """
-        api_key = self.api_keys[0]
-        all_articles = []
-        date = datetime.strptime(self.start_date, "%Y-%m-%d")
-        today = datetime.now()
-
-        while date <= today:
-            date_str = date.strftime("%Y-%m-%d")
-            url = (
-                f"https://newsapi.org/v2/everything?q={self.name}"
-                f"&from={date_str}&to={date_str}&sortBy=popularity&apiKey={api_key}"
-            )
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            date += timedelta(days=1)
+            pd.DataFrame: DataFrame containing article headline, publication date, and description,
+                backed by pyarrow dtypes.
+        """
+        titles, dates, descriptions = [], [], []
+        errors = set()
+        for articles, error in _run_sync(self._fetch_all()):
+            if error is not None:
+                errors.add(error[1])
+                continue
+            for title, date, description in articles:
+                titles.append(title)
+                dates.append(date)
+                descriptions.append(description)
 
-            if "articles" in data:
-                if not data["articles"]:
-                    continue
-                all_articles.extend(data["articles"])
-            else:
-                break
+        for message in errors:
+            print(f"NewsAPI error: {message}")
 
-        headlines = [
-            (article["title"], article["publishedAt"], article["description"])
-            for article in all_articles
-        ]
-        return pd.DataFrame(headlines, columns=["headline", "date", "description"])
+        return pd.DataFrame(
+            {
+                "headline": pd.Series(titles, dtype=NEWS_TEXT_DTYPE),
+                "date": _parse_news_dates(dates),
+                "description": pd.Series(descriptions, dtype=NEWS_TEXT_DTYPE),
+            }
+        )
 
     def load_apitube_data(self) -> pd.DataFrame:
         """
         Fetches news articles related to the stock using the APITube API.
 
         Returns:
-            pd.DataFrame: DataFrame containing article headline, publication date, and description.
+            pd.DataFrame: DataFrame containing article headline, publication date, and description,
+                backed by pyarrow dtypes.
         """
         api_key = self.api_keys[1]
         url = "https://api.apitube.io/v1/news/top-headlines"
@@ -135,21 +478,27 @@ class LoadData:
             "sort_by": "published_at",
         }
 
-        response = requests.get(url, params=query_params, timeout=10)
+        response = self._session.get(url, params=query_params, timeout=10)
         data = response.json()
 
         if "results" not in data:
             print("No results found in APITube response.")
             return pd.DataFrame()
 
-        records = [
+        # Keep the first article for each headline, deduplicating in a single pass.
+        articles = {}
+        for item in data["results"]:
+            articles.setdefault(
+                item["title"], (item["published_at"], item["description"])
+            )
+
+        return pd.DataFrame(
             {
-                "date": item["published_at"],
-                "headline": item["title"],
-                "description": item["description"],
+                "date": _parse_news_dates([date for date, _ in articles.values()]),
+                "headline": pd.Series(list(articles), dtype=NEWS_TEXT_DTYPE),
+                "description": pd.Series(
+                    [description for _, description in articles.values()],
+                    dtype=NEWS_TEXT_DTYPE,
+                ),
             }
-            for item in data["results"]
-        ]
-
-        df = pd.DataFrame(records).drop_duplicates(subset=["headline"])
-        return df
+        )
@@ -1,6 +1,36 @@
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from transformers import pipeline
+from collections import OrderedDict
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from optimum.pipelines import pipeline as ort_pipeline
+from pathlib import Path
+from transformers import AutoTokenizer, Pipeline, pipeline
+import numpy as np
 import pandas as pd
+import torch
+
+FINBERT_MODEL = "ProsusAI/finbert"
+
+# Location of the int8-quantized ONNX export of FinBERT used for CPU inference.
+FINBERT_QUANTIZED_DIR = Path(".cache") / "finbert-int8"
+FINBERT_QUANTIZED_FILE = "model_quantized.onnx"
+
+# Number of texts per FinBERT forward pass.
+FINBERT_BATCH_SIZE = 32
+
+# Maximum number of FinBERT classifications remembered per Sentiment instance.
+FINBERT_CACHE_SIZE = 4096
+
+_FINBERT_SCORES = {"positive": 1, "negative": -1}
+
+
+def _valid_texts(column: pd.Series) -> list[str]:
+    """
+    Returns the distinct non-empty strings in a text column.
+    """
+    texts = pd.Series(column.dropna().unique(), dtype=object)
+    mask = texts.map(lambda text: isinstance(text, str) and bool(text.strip()))
+    return texts[mask.astype(bool)].tolist()
 
 
 class Sentiment:
@@ -15,27 +45,56 @@ class Sentiment:
         Initializes the sentiment analyzers.
         """
         self.vader = SentimentIntensityAnalyzer()
-        self.finbert = pipeline("sentiment-analysis", model="ProsusAI/finbert")
+        self.finbert = self._load_finbert()
+        self._finbert_cache: OrderedDict[str, int] = OrderedDict()
 
-    def _get_vader_sentiment(self, text: str) -> float:
+    def _load_finbert(self) -> Pipeline:
         """
-        Computes compound VADER sentiment score for a given text.
+        Loads the FinBERT sentiment pipeline.
 
-        Args:
-            text (str): The text to analyze.
+        On a GPU the PyTorch checkpoint is loaded in float16. On CPU the model is exported
+        to ONNX and dynamically quantized to int8 once, then loaded from
+        FINBERT_QUANTIZED_DIR.
 
         Returns:
-            float: Compound sentiment score in range [-1, 1].
+            Pipeline: A sentiment-analysis pipeline.
         """
-        if not isinstance(text, str) or not text.strip():
-            return 0.0
-        sentiment = self.vader.polarity_scores(text)
-        return sentiment["compound"]
+        if torch.cuda.is_available():
+            return pipeline(
+                "sentiment-analysis",
+                model=FINBERT_MODEL,
+                device=0,
+                torch_dtype=torch.float16,
+            )
+
+        if not (FINBERT_QUANTIZED_DIR / FINBERT_QUANTIZED_FILE).exists():
+            model = ORTModelForSequenceClassification.from_pretrained(
+                FINBERT_MODEL, export=True
+            )
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=FINBERT_QUANTIZED_DIR,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(
+                    is_static=False, per_channel=False
+                ),
+            )
+            model.config.save_pretrained(FINBERT_QUANTIZED_DIR)
+
+        model = ORTModelForSequenceClassification.from_pretrained(
+            FINBERT_QUANTIZED_DIR, file_name=FINBERT_QUANTIZED_FILE
+        )
+        tokenizer = AutoTokenizer.from_pretrained(FINBERT_MODEL)
+        return ort_pipeline(
+            "text-classification", model=model, tokenizer=tokenizer, accelerator="ort"
+        )
 
     def add_vader_sentiment(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Adds a VADER sentiment score column to the DataFrame.
 
+        Each distinct non-empty headline is scored once; missing or blank headlines
+        score 0.0.
+
         Args:
             df (pd.DataFrame): DataFrame containing a 'headline' column.
 
@@ -45,7 +104,14 @@ class Sentiment:
         if "headline" not in df.columns:
             raise ValueError("Missing 'headline' column in input DataFrame.")
 
-        df["sentiment"] = df["headline"].apply(self._get_vader_sentiment)
+        scorer = self.vader.polarity_scores
+        headlines = _valid_texts(df["headline"])
+        scores = np.empty(len(headlines), dtype=np.float32)
+        for i, text in enumerate(headlines):
+            scores[i] = scorer(text)["compound"]
+
+        mapping = dict(zip(headlines, scores))
+        df["sentiment"] = df["headline"].map(mapping).fillna(0.0).astype(np.float32)
         return df
 
     def _get_finbert_sentiment(self, text: str) -> int:
@@ -61,14 +127,51 @@ class Sentiment:
         if not isinstance(text, str) or not text.strip():
             return 0
 
-        result = self.finbert(text)[0]
-        label = result["label"].lower()
-        return {"positive": 1, "negative": -1}.get(label, 0)
+        return self._classify_finbert([text])[0]
+
+    def _classify_finbert(self, texts: list[str]) -> list[int]:
+        """
+        Classifies texts with FinBERT, reusing results for texts seen before.
+
+        Texts not in the cache are classified in batches of FINBERT_BATCH_SIZE. The cache
+        keeps the FINBERT_CACHE_SIZE most recently used texts.
+
+        Args:
+            texts (list[str]): Non-empty financial news descriptions.
+
+        Returns:
+            list[int]: Sentiment class per text (1=positive, -1=negative, 0=neutral).
+        """
+        cache = self._finbert_cache
+        misses = [text for text in texts if text not in cache]
+
+        if misses:
+            results = self.finbert(
+                misses,
+                batch_size=FINBERT_BATCH_SIZE,
+                truncation=True,
+                padding=True,
+            )
+            for text, result in zip(misses, results):
+                cache[text] = _FINBERT_SCORES.get(result["label"].lower(), 0)
+
+        scores = []
+        for text in texts:
+            cache.move_to_end(text)
+            scores.append(cache[text])
+
+        while len(cache) > FINBERT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return scores
 
     def add_finbert_sentiment(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Adds a FinBERT sentiment score column to the DataFrame.
 
+        Each distinct non-empty description is classified once, in batches of
+        FINBERT_BATCH_SIZE; missing or blank descriptions score 0.
+        Descriptions classified by earlier calls are taken from the cache.
+
         Args:
             df (pd.DataFrame): DataFrame containing a 'description' column.
 
@@ -78,5 +181,11 @@ class Sentiment:
         if "description" not in df.columns:
             raise ValueError("Missing 'description' column in input DataFrame.")
 
-        df["finbert_sentiment"] = df["description"].apply(self._get_finbert_sentiment)
+        descriptions = _valid_texts(df["description"])
+        scores = self._classify_finbert(descriptions)
+
+        mapping = dict(zip(descriptions, scores))
+        df["finbert_sentiment"] = (
+            df["description"].map(mapping).fillna(0).astype(np.int8)
+        )
         return df
@@ -0,0 +1,47 @@
+import pytest
+
+WORDS = ["shares", "rallied", "profit", "fell", "great", "quarter", "bad", "loss"]
+
+
+@pytest.fixture(scope="session")
+def tiny_finbert(tmp_path_factory):
+    """
+    Saves a tiny randomly initialized BERT classifier with FinBERT's labels.
+
+    Built locally so the sentiment tests do not download a checkpoint.
+    """
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    path = tmp_path_factory.mktemp("tiny-finbert")
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *WORDS]
+    (path / "vocab.txt").write_text("\n".join(vocab) + "\n")
+    tokenizer = transformers.BertTokenizerFast(vocab_file=str(path / "vocab.txt"))
+
+    labels = ["positive", "negative", "neutral"]
+    config = transformers.BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        num_labels=len(labels),
+        id2label=dict(enumerate(labels)),
+        label2id={label: i for i, label in enumerate(labels)},
+    )
+    torch.manual_seed(0)
+    transformers.BertForSequenceClassification(config).save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    return str(path)
+
+
+@pytest.fixture
+def sentiment(monkeypatch, tmp_path, tiny_finbert):
+    """
+    Builds a Sentiment on the CPU path, backed by the tiny local checkpoint.
+    """
+    module = pytest.importorskip("functions.sentiment")
+    monkeypatch.setattr(module.torch.cuda, "is_available", lambda: False)
+    monkeypatch.setattr(module, "FINBERT_MODEL", tiny_finbert)
+    monkeypatch.setattr(module, "FINBERT_QUANTIZED_DIR", tmp_path / "finbert-int8")
+    return module.Sentiment()
@@ -0,0 +1,410 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import pytest
+
+from functions import load_data
+from functions.load_data import LoadData, NEWS_CONCURRENCY
+
+
+@pytest.fixture
+def loader():
+    """
+    Builds a LoadData without touching the network or the .env file.
+    """
+    loader = LoadData.__new__(LoadData)
+    loader.stock_symbol = "AAPL"
+    loader.start_date = (datetime.now() - timedelta(days=9)).strftime("%Y-%m-%d")
+    loader.api_keys = ("news-key", "apitube-key")
+    loader.name = "Apple"
+    loader._news_base = "https://newsapi.org/v2/everything?q=Apple&apiKey=news-key"
+    return loader
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(load_data, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def _price_frame():
+    return pd.DataFrame(
+        {
+            "Open": [1.0, 2.0],
+            "High": [1.5, 2.5],
+            "Low": [0.5, 1.5],
+            "Close": [1.2, 2.2],
+            "Volume": [100, 200],
+        },
+        index=pd.DatetimeIndex(["2025-01-02", "2025-01-03"], name="Date"),
+    )
+
+
+def _grouped_download(tickers, missing=()):
+    """
+    Mimics yf.download(..., group_by="ticker"): (Ticker, Price) MultiIndex columns.
+    """
+    frames = {
+        ticker: _price_frame() for ticker in tickers.split() if ticker not in missing
+    }
+    return pd.concat(frames, axis=1)
+
+
+def _article(title, published_at="2025-01-01T00:00:00Z"):
+    return {"title": title, "publishedAt": published_at, "description": f"{title}."}
+
+
+def _row(title, published_at="2025-01-01T00:00:00Z"):
+    article = _article(title, published_at)
+    return article["title"], article["publishedAt"], article["description"]
+
+
+class _FakeNewsSession:
+    """
+    Stands in for aiohttp.ClientSession, answering every GET with the same JSON body.
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def json(self):
+        return self._data
+
+
+def test_fetch_day_keeps_only_article_fields(loader):
+    data = {
+        "status": "ok",
+        "articles": [dict(_article("Apple rallies"), url="https://example.com")],
+    }
+    session = _FakeNewsSession(data)
+
+    articles, error = asyncio.run(
+        loader._fetch_day(session, asyncio.Semaphore(1), "2025-01-01")
+    )
+
+    assert articles == [_row("Apple rallies")]
+    assert error is None
+
+
+def test_fetch_day_reports_error_code_and_message(loader):
+    session = _FakeNewsSession(
+        {"status": "error", "code": "rateLimited", "message": "Too many requests."}
+    )
+
+    articles, error = asyncio.run(
+        loader._fetch_day(session, asyncio.Semaphore(1), "2025-01-01")
+    )
+
+    assert articles == []
+    assert error == ("rateLimited", "Too many requests.")
+
+
+def test_news_articles_are_ordered_by_day(monkeypatch, loader):
+    async def fake_fetch_day(self, session, semaphore, date_str):
+        # Later days finish first, the result must still follow the calendar.
+        await asyncio.sleep(0.001 * (31 - int(date_str[-2:])))
+        return [_row(date_str)], None
+
+    monkeypatch.setattr(LoadData, "_fetch_day", fake_fetch_day)
+
+    df = loader.load_news_data()
+
+    assert len(df) == 10
+    assert df["headline"].tolist() == sorted(df["headline"])
+
+
+def test_news_day_errors_are_skipped(monkeypatch, loader, capsys):
+    async def fake_fetch_day(self, session, semaphore, date_str):
+        if date_str == loader.start_date:
+            return [], ("parameterInvalid", "too far in the past")
+        return [_row(date_str)], None
+
+    monkeypatch.setattr(LoadData, "_fetch_day", fake_fetch_day)
+
+    df = loader.load_news_data()
+
+    assert len(df) == 9
+    assert "too far in the past" in capsys.readouterr().out
+
+
+def test_news_fatal_error_cancels_remaining_days(monkeypatch, loader, capsys):
+    requested = []
+
+    async def fake_fetch_day(self, session, semaphore, date_str):
+        async with semaphore:
+            requested.append(date_str)
+            await asyncio.sleep(0.01)
+            return [], ("apiKeyInvalid", "Your API key is invalid.")
+
+    monkeypatch.setattr(LoadData, "_fetch_day", fake_fetch_day)
+    loader.start_date = (datetime.now() - timedelta(days=83)).strftime("%Y-%m-%d")
+
+    df = loader.load_news_data()
+
+    assert df.empty
+    assert len(requested) <= NEWS_CONCURRENCY
+    assert "Your API key is invalid." in capsys.readouterr().out
+
+
+def test_stock_data_is_served_from_fresh_cache(monkeypatch, loader, cache_dir):
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(tickers)
+        return _grouped_download(tickers)
+
+    monkeypatch.setattr(load_data.yf, "download", fake_download)
+
+    first = loader.load_stock_data()
+    second = loader.load_stock_data()
+
+    assert len(downloads) == 1
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+
+def test_stale_stock_cache_is_downloaded_again(monkeypatch, loader, cache_dir):
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(tickers)
+        return _grouped_download(tickers)
+
+    monkeypatch.setattr(load_data.yf, "download", fake_download)
+
+    loader.load_stock_data()
+    expired = (datetime.now() - load_data.CACHE_TTL - timedelta(minutes=1)).timestamp()
+    for path in cache_dir.glob("*.parquet"):
+        os.utime(path, (expired, expired))
+    loader.load_stock_data()
+
+    assert len(downloads) == 2
+
+
+def test_load_many_batches_symbols(monkeypatch, cache_dir):
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(tickers.split())
+        data = _grouped_download(tickers, missing={"SYM7"})
+        # A symbol that only started trading on the second day.
+        if "SYM3" in data.columns.get_level_values(0):
+            data.loc[data.index[0], "SYM3"] = float("nan")
+        return data
+
+    monkeypatch.setattr(load_data.yf, "download", fake_download)
+    symbols = [f"SYM{i}" for i in range(45)]
+
+    results = LoadData.load_many(symbols)
+
+    assert [len(batch) for batch in downloads] == [20, 20, 5]
+    assert set(results) == set(symbols) - {"SYM7"}
+    assert list(results["SYM0"].columns) == load_data.STOCK_COLUMNS
+    assert len(results["SYM3"]) == 1
+    assert len(list(cache_dir.glob("*.parquet"))) == 44
+
+
+def test_load_many_skips_cached_symbols(monkeypatch, cache_dir):
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(tickers.split())
+        return _grouped_download(tickers)
+
+    monkeypatch.setattr(load_data.yf, "download", fake_download)
+
+    LoadData.load_many(["AAPL"])
+    results = LoadData.load_many(["AAPL", "MSFT"])
+
+    assert downloads == [["AAPL"], ["MSFT"]]
+    assert set(results) == {"AAPL", "MSFT"}
+
+
+def test_news_dates_are_parsed_as_mixed_iso8601(monkeypatch, loader):
+    published = ["2025-01-01T00:00:00Z", "2025-01-02T00:00:00.123Z", "not a date"]
+
+    async def fake_fetch_day(self, session, semaphore, date_str):
+        if date_str != loader.start_date:
+            return [], None
+        return [_row(str(i), at) for i, at in enumerate(published)], None
+
+    monkeypatch.setattr(LoadData, "_fetch_day", fake_fetch_day)
+
+    df = loader.load_news_data()
+
+    assert list(df.columns) == ["headline", "date", "description"]
+    assert df["date"].iloc[0] == pd.Timestamp("2025-01-01", tz="UTC")
+    assert df["date"].iloc[1] == pd.Timestamp("2025-01-02 00:00:00.123", tz="UTC")
+    assert pd.isna(df["date"].iloc[2])
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def test_apitube_keeps_first_article_per_headline(monkeypatch, loader):
+    results = [
+        {"title": "A", "published_at": "2025-01-01T00:00:00Z", "description": "first"},
+        {"title": "B", "published_at": "2025-01-02T00:00:00.5Z", "description": "b"},
+        {"title": "A", "published_at": "2025-01-03T00:00:00Z", "description": "later"},
+    ]
+    loader._session = type("Session", (), {})()
+    loader._session.get = lambda url, **kwargs: _FakeResponse({"results": results})
+
+    df = loader.load_apitube_data()
+
+    assert df["headline"].tolist() == ["A", "B"]
+    assert df["description"].tolist() == ["first", "b"]
+    assert df["date"].iloc[1] == pd.Timestamp("2025-01-02 00:00:00.5", tz="UTC")
+
+
+def test_missing_api_keys_raise(monkeypatch):
+    monkeypatch.setattr(load_data, "load_dotenv", lambda: None)
+    monkeypatch.delenv("API_KEY_NEWSAPI", raising=False)
+    monkeypatch.setenv("API_KEY_APITUBE", "apitube-key")
+    load_data._load_api_keys.cache_clear()
+
+    with pytest.raises(ValueError, match="NewsAPI"):
+        load_data._load_api_keys()
+
+    monkeypatch.setenv("API_KEY_NEWSAPI", "news-key")
+    assert load_data._load_api_keys() == ("news-key", "apitube-key")
+    load_data._load_api_keys.cache_clear()
+
+
+class _FakeTicker:
+    def __init__(self, metadata=None):
+        self._metadata = metadata
+
+    @property
+    def history_metadata(self):
+        if self._metadata is None:
+            raise ConnectionError("chart request failed")
+        return self._metadata
+
+
+@pytest.mark.parametrize(
+    ("metadata", "expected"),
+    [
+        ({"longName": "Acme Widgets Inc.", "shortName": "Acme"}, "Acme"),
+        ({"longName": "Acme Widgets Co., Ltd."}, "Acme Widgets"),
+        ({"shortName": "Acme Holdings plc"}, "Acme Holdings"),
+        ({}, "ACME"),
+        (None, "ACME"),
+    ],
+)
+def test_unmapped_name_comes_from_history_metadata(monkeypatch, metadata, expected):
+    monkeypatch.setattr(load_data, "_load_api_keys", lambda: ("news", "apitube"))
+    monkeypatch.setattr(load_data, "_get_ticker", lambda symbol: _FakeTicker(metadata))
+
+    with LoadData("ACME") as loader:
+        assert loader.name == expected
+
+
+def test_news_query_is_url_encoded(monkeypatch):
+    monkeypatch.setattr(load_data, "_load_api_keys", lambda: ("news", "apitube"))
+    monkeypatch.setattr(
+        load_data,
+        "_get_ticker",
+        lambda symbol: _FakeTicker({"longName": "Procter & Gamble Co"}),
+    )
+    session = _FakeNewsSession({"status": "ok", "articles": []})
+
+    with LoadData("PG") as loader:
+        asyncio.run(loader._fetch_day(session, asyncio.Semaphore(1), "2025-01-01"))
+
+    query = parse_qs(urlsplit(session.urls[0]).query)
+    assert query["q"] == ["Procter & Gamble"]
+    assert query["from"] == query["to"] == ["2025-01-01"]
+    assert query["apiKey"] == ["news"]
+
+
+@pytest.mark.parametrize(
+    "layout", ["ticker_price", "price_ticker"], ids=["group_by_ticker", "default"]
+)
+def test_split_by_ticker_handles_multiindex_layouts(layout):
+    data = _grouped_download("AAPL MSFT")
+    if layout == "price_ticker":
+        data = data.swaplevel(axis=1).sort_index(axis=1)
+
+    frames = load_data._split_by_ticker(data, ["aapl", "MSFT", "TSLA"])
+
+    assert set(frames) == {"aapl", "MSFT"}
+    for frame in frames.values():
+        pd.testing.assert_frame_equal(
+            frame[load_data.STOCK_COLUMNS], _price_frame(), check_names=False
+        )
+
+
+def test_split_by_ticker_accepts_flat_single_symbol():
+    data = _price_frame()
+
+    assert load_data._split_by_ticker(data, ["AAPL"])["AAPL"] is data
+    assert load_data._split_by_ticker(data, ["AAPL", "MSFT"]) == {}
+
+
+def test_empty_flat_download_is_reported_missing(monkeypatch, cache_dir, capsys):
+    monkeypatch.setattr(
+        load_data.yf, "download", lambda tickers, **kwargs: pd.DataFrame()
+    )
+
+    assert LoadData.load_many(["AAPL"]) == {}
+    assert "No data found for 'AAPL'." in capsys.readouterr().out
+
+
+def test_empty_news_table_keeps_arrow_dtypes(monkeypatch, loader):
+    async def fake_fetch_day(self, session, semaphore, date_str):
+        return [], None
+
+    monkeypatch.setattr(LoadData, "_fetch_day", fake_fetch_day)
+
+    df = loader.load_news_data()
+
+    assert df.empty
+    assert df["headline"].dtype == load_data.NEWS_TEXT_DTYPE
+    assert df["description"].dtype == load_data.NEWS_TEXT_DTYPE
+    assert df["date"].dtype == load_data.NEWS_DATE_DTYPE
+
+
+def test_download_skips_progress_bar_and_adjusts_prices(monkeypatch, cache_dir):
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(kwargs)
+        return _grouped_download(tickers)
+
+    monkeypatch.setattr(load_data.yf, "download", fake_download)
+
+    LoadData.load_many(["AAPL"])
+
+    assert calls[0]["progress"] is False
+    assert calls[0]["auto_adjust"] is True
+    assert calls[0]["prepost"] is False
+
+
+def test_mapped_tickers_skip_yahoo_finance(monkeypatch):
+    def fail(symbol):
+        raise AssertionError("mapped tickers should not query Yahoo Finance")
+
+    monkeypatch.setattr(load_data, "_load_api_keys", lambda: ("news", "apitube"))
+    monkeypatch.setattr(load_data, "_get_ticker", fail)
+
+    with LoadData("aapl") as loader:
+        assert loader.name == "Apple"
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_finbert_scores_descriptions_in_one_batch(sentiment):
+    calls = []
+    finbert = sentiment.finbert
+
+    def spy(texts, **kwargs):
+        calls.append(texts)
+        return finbert(texts, **kwargs)
+
+    sentiment.finbert = spy
+    descriptions = ["Shares rallied.", None, "  ", "Profit fell.", "Great quarter!"]
+    df = pd.DataFrame({"description": descriptions})
+
+    result = sentiment.add_finbert_sentiment(df)
+
+    assert len(calls) == 1
+    assert len(calls[0]) == 3
+    assert result["finbert_sentiment"].dtype == np.int8
+    assert result["finbert_sentiment"].isin([-1, 0, 1]).all()
+    assert result["finbert_sentiment"].iloc[1] == 0
+    assert result["finbert_sentiment"].iloc[2] == 0
+
+
+def test_quantized_finbert_is_reused_from_disk(monkeypatch, sentiment):
+    from functions import sentiment as module
+
+    assert isinstance(sentiment.finbert.model, module.ORTModelForSequenceClassification)
+    assert (module.FINBERT_QUANTIZED_DIR / module.FINBERT_QUANTIZED_FILE).exists()
+
+    def fail_export(*args, **kwargs):
+        raise AssertionError("the quantized model should be loaded from disk")
+
+    monkeypatch.setattr(module.ORTQuantizer, "from_pretrained", fail_export)
+    reloaded = module.Sentiment()
+
+    assert reloaded._get_finbert_sentiment("Profit fell.") in (-1, 0, 1)
+
+
+def test_vader_scores_headlines_as_float32(sentiment):
+    df = pd.DataFrame({"headline": ["Great quarter!", None, "", "Bad loss"]})
+
+    result = sentiment.add_vader_sentiment(df)
+
+    assert result["sentiment"].dtype == np.float32
+    assert result["sentiment"].iloc[0] > 0
+    assert result["sentiment"].iloc[1] == 0.0
+    assert result["sentiment"].iloc[2] == 0.0
+    assert result["sentiment"].iloc[3] < 0
+
+
+def test_duplicate_texts_are_scored_once(sentiment):
+    finbert_texts = []
+    finbert = sentiment.finbert
+
+    def finbert_spy(texts, **kwargs):
+        finbert_texts.extend(texts)
+        return finbert(texts, **kwargs)
+
+    vader_texts = []
+    polarity_scores = sentiment.vader.polarity_scores
+
+    def vader_spy(text):
+        vader_texts.append(text)
+        return polarity_scores(text)
+
+    sentiment.finbert = finbert_spy
+    sentiment.vader.polarity_scores = vader_spy
+    texts = ["Shares rallied.", "Profit fell.", "Shares rallied.", "Shares rallied."]
+    df = pd.DataFrame({"headline": texts, "description": texts})
+
+    result = sentiment.add_finbert_sentiment(sentiment.add_vader_sentiment(df))
+
+    assert sorted(finbert_texts) == ["Profit fell.", "Shares rallied."]
+    assert sorted(vader_texts) == ["Profit fell.", "Shares rallied."]
+    assert result["finbert_sentiment"].iloc[0] == result["finbert_sentiment"].iloc[3]
+    assert result["sentiment"].iloc[0] == result["sentiment"].iloc[2]
+
+
+def test_finbert_results_are_cached_across_calls(monkeypatch, sentiment):
+    from functions import sentiment as module
+
+    monkeypatch.setattr(module, "FINBERT_CACHE_SIZE", 2)
+    batches = []
+    finbert = sentiment.finbert
+
+    def spy(texts, **kwargs):
+        batches.append(list(texts))
+        return finbert(texts, **kwargs)
+
+    sentiment.finbert = spy
+
+    sentiment.add_finbert_sentiment(pd.DataFrame({"description": ["Shares rallied."]}))
+    sentiment.add_finbert_sentiment(
+        pd.DataFrame({"description": ["Shares rallied.", "Profit fell."]})
+    )
+    sentiment._get_finbert_sentiment("Great quarter!")
+    sentiment._get_finbert_sentiment("Shares rallied.")
+
+    assert batches == [
+        ["Shares rallied."],
+        ["Profit fell."],
+        ["Great quarter!"],
+        ["Shares rallied."],
+    ]
+    assert len(sentiment._finbert_cache) == 2
+
+
+def test_columns_without_strings_score_zero(sentiment):
+    def fail(texts, **kwargs):
+        raise AssertionError("no text should reach FinBERT")
+
+    sentiment.finbert = fail
+    df = pd.DataFrame(
+        {
+            "headline": [1, 2, 2],
+            "description": pd.Series([3.5, None, 3.5], dtype=object),
+        }
+    )
+
+    result = sentiment.add_finbert_sentiment(sentiment.add_vader_sentiment(df))
+
+    assert result["sentiment"].tolist() == [0.0, 0.0, 0.0]
+    assert result["finbert_sentiment"].tolist() == [0, 0, 0]
+    assert sentiment.add_vader_sentiment(pd.DataFrame({"headline": []})).empty
+
+
+def test_finbert_runs_in_float16_on_cuda(monkeypatch, tiny_finbert):
+    torch = pytest.importorskip("torch")
+    if not torch.cuda.is_available():
+        pytest.skip("needs a CUDA device")
+    from functions import sentiment as module
+
+    monkeypatch.setattr(module, "FINBERT_MODEL", tiny_finbert)
+
+    assert module.Sentiment().finbert.model.dtype == torch.float16